@@ -4,58 +4,97 @@ author: Carson Bragg
 date: nov 11, 2025
 '''
 
+import sys
+from collections import deque
+from types import MappingProxyType
 from typing import Final
 
 # Symbol used to represent epsilon on the right side of productions
 EPSILON: Final[str] = 'eps'
 
-def compute_generating_nonterminals(cfg):
-    # Compute set of nonterminals that can derive some terminal string
-    nonterminals = cfg['nonterminals']
+# Sample CFG whose language is empty, frozen since it is never modified
+CFG_EMPTY: Final[MappingProxyType] = MappingProxyType({
+    'nonterminals': ('S', 'A'),
+    'terminals': ('a', 'b'),
+    'start_symbol': 'S',
+    'productions': MappingProxyType({
+        'S': (('A',),)
+    })
+})
+
+# Sample CFG whose language is not empty
+CFG_NONEMPTY: Final[MappingProxyType] = MappingProxyType({
+    'nonterminals': ('S', 'A'),
+    'terminals': ('a', 'b'),
+    'start_symbol': 'S',
+    'productions': MappingProxyType({
+        'S': (('A',), (EPSILON,)),
+        'A': (('a', 'A'), ('a',))
+    })
+})
+
+def compute_generating_nonterminals(cfg, target=None):
+    # Compute set of nonterminals that can derive some terminal string,
+    # stopping early once the optional target nonterminal is found
+    nonterminal_set = frozenset(cfg['nonterminals'])
     productions = cfg['productions']
     generating = set()
-    changed = True
-
-    # Repeat until no new generating nonterminals are found
-    while changed:
-        changed = False
-        for non_term in nonterminals:
-            # Skip nonterminals already known to be generating
-            if non_term in generating:
+
+    # Record left side and count of distinct nonterminals each production waits on
+    prod_lhs = []
+    remaining = []
+    # Map each nonterminal to the productions waiting on it
+    waiters = {}
+    # Nonterminals ready to be marked as generating
+    worklist = deque()
+
+    for non_term, right_side_list in productions.items():
+        for right_side in right_side_list:
+            # Nonterminal directly generates epsilon
+            if len(right_side) == 1 and right_side[0] is EPSILON:
+                worklist.append(non_term)
                 continue
-            # Skip nonterminals without productions
-            if non_term not in productions:
+
+            prod_id = len(prod_lhs)
+            prod_lhs.append(non_term)
+
+            # All-terminal right sides have no dependencies
+            deps = set()
+            for sym in right_side:
+                if sym in nonterminal_set:
+                    deps.add(sym)
+            remaining.append(len(deps))
+
+            if not deps:
+                worklist.append(non_term)
                 continue
 
-            right_side_list = productions[non_term]
-            # Check each production for current nonterminal
-            for right_side in right_side_list:
-                # Nonterminal directly generates epsilon
-                if len(right_side) == 1 and right_side[0] == EPSILON:
-                    generating.add(non_term)
-                    changed = True
-                    break
-
-                # Assume all nonterminals on right side are already generating
-                all_symbols_good = True
-                for sym in right_side:
-                    if sym in nonterminals:
-                        if sym not in generating:
-                            all_symbols_good = False
-                            break
-
-                # Mark nonterminal as generating when all nonterminals on right side are generating
-                if all_symbols_good:
-                    generating.add(non_term)
-                    changed = True
-                    break
+            for dep in deps:
+                waiters.setdefault(dep, []).append(prod_id)
+
+    # Propagate generating nonterminals to productions waiting on them
+    while worklist:
+        non_term = worklist.popleft()
+        # Skip nonterminals already known to be generating
+        if non_term in generating:
+            continue
+        generating.add(non_term)
+        if non_term == target:
+            return generating
+
+        # Production becomes satisfied when its last dependency is generating
+        for prod_id in waiters.get(non_term, ()):
+            remaining[prod_id] -= 1
+            if remaining[prod_id] == 0:
+                worklist.append(prod_lhs[prod_id])
 
     return generating
 
 def cfg_language_is_empty(cfg):
     # Decide whether CFG language is empty based on generating nonterminals
-    generating = compute_generating_nonterminals(cfg)
+    # Only the start symbol matters, so stop once it is generating
     start_symbol = cfg['start_symbol']
+    generating = compute_generating_nonterminals(cfg, target=start_symbol)
 
     # Language is non-empty when start symbol can generate some string
     if start_symbol in generating:
@@ -66,11 +105,13 @@ def cfg_language_is_empty(cfg):
 
 def print_cfg(cfg, index):
     # Print CFG structure in readable format
-    print(f"CFG #{index}")
-    print(f"  Nonterminals: {cfg['nonterminals']}")
-    print(f"  Terminals: {cfg['terminals']}")
-    print(f"  Start symbol: {cfg['start_symbol']}")
-    print("  Productions:")
+    # Collect lines and write them out in a single call
+    out = []
+    out.append(f"CFG #{index}")
+    out.append(f"  Nonterminals: {list(cfg['nonterminals'])}")
+    out.append(f"  Terminals: {list(cfg['terminals'])}")
+    out.append(f"  Start symbol: {cfg['start_symbol']}")
+    out.append("  Productions:")
 
     productions = cfg['productions']
     # Walk through nonterminals that have productions
@@ -80,13 +121,13 @@ def print_cfg(cfg, index):
 
             # Print each right side for current nonterminal
             for right_side in right_side_list:
-                if len(right_side) == 1 and right_side[0] == EPSILON:
+                if len(right_side) == 1 and right_side[0] is EPSILON:
                     right_side_str = EPSILON
                 else:
                     right_side_str = ''.join(right_side)
 
-                print(f"    {non_term} -> {right_side_str}")
-    print()
+                out.append(f"    {non_term} -> {right_side_str}")
+    sys.stdout.write('\n'.join(out) + '\n\n')
 
 def display_start_msg():
     # Print description of program behavior and output format
@@ -102,39 +143,12 @@ def display_start_msg():
             "empty language, 0 otherwise).\n")
 
 def build_example_cfg_empty():
-    # Build sample CFG whose language is empty
-    nonterminals = ['S', 'A']
-    terminals = ['a', 'b']
-    start_symbol = 'S'
-
-    productions = {}
-    productions['S'] = [['A']]
-
-    cfg = {
-        'nonterminals': nonterminals,
-        'terminals': terminals,
-        'start_symbol': start_symbol,
-        'productions': productions
-    }
-    return cfg
+    # Return sample CFG whose language is empty
+    return CFG_EMPTY
 
 def build_example_cfg_nonempty():
-    # Build sample CFG whose language is not empty
-    nonterminals = ['S', 'A']
-    terminals = ['a', 'b']
-    start_symbol = 'S'
-
-    productions = {}
-    productions['S'] = [['A'], [EPSILON]]
-    productions['A'] = [['a', 'A'], ['a']]
-
-    cfg = {
-        'nonterminals': nonterminals,
-        'terminals': terminals,
-        'start_symbol': start_symbol,
-        'productions': productions
-    }
-    return cfg
+    # Return sample CFG whose language is not empty
+    return CFG_NONEMPTY
 
 def main():
     # Entry point for program execution
@@ -4,6 +4,8 @@ author: Carson Bragg
 date: nov 10, 2025
 '''
 
+import sys
+from collections import defaultdict, deque
 from typing import Final
 
 # Global symbols for input alphabet, tape alphabet, and head moves
@@ -11,6 +13,13 @@ INPUT_ALPHABET: Final[list] = ['a', 'b']
 TAPE_ALPHABET: Final[list] = ['a', 'b', '_']
 MOVES: Final[list] = ['L', 'R']
 
+# Integer code of each tape symbol for packed TM tables
+SYMBOL_CODE: Final[dict] = {'a': 0, 'b': 1, '_': 2}
+
+# Translation table from symbol codes back to tape symbol bytes
+CODE_TO_ASCII: Final[bytes] = bytes.maketrans(
+    bytes(range(len(TAPE_ALPHABET))), ''.join(TAPE_ALPHABET).encode('ascii'))
+
 def epsilon_closure(nfa, state_set):
     # Compute epsilon-closure for a set of NFA states
     closure = set(state_set)
@@ -30,71 +39,85 @@ def epsilon_closure(nfa, state_set):
 
     return closure
 
-def move_nfa(nfa, state_set, symbol):
-    # Compute NFA move set on a given input symbol
-    result = set()
-
-    for state in state_set:
-        key = (state, symbol)
-        if key in nfa['transitions']:
-            next_states = nfa['transitions'][key]
-            for nxt in next_states:
-                result.add(nxt)
-
-    return result
-
 def nfa_to_dfa(nfa):
     # Convert NFA description to equivalent DFA description
     start_state = nfa['start_state']
     alphabet = nfa['alphabet']
-    accept_states_nfa = set(nfa['accept_states'])
+    # Give each NFA state a bit index so subsets become integer bitmasks
+    index_of = {}
+    for i, s in enumerate(nfa['states']):
+        index_of[s] = i
+
+    # Epsilon-closure of each NFA state as a bitmask
+    eps_mask = []
+    for s in nfa['states']:
+        mask = 0
+        for c in epsilon_closure(nfa, {s}):
+            mask |= 1 << index_of[c]
+        eps_mask.append(mask)
+
+    # Group NFA transitions by state, then by symbol
+    trans_by_state = defaultdict(dict)
+    for (s, symbol), next_states in nfa['transitions'].items():
+        trans_by_state[s][symbol] = next_states
+
+    # Epsilon-closure of each state's move on each symbol as a bitmask
+    move_mask = []
+    for s in nfa['states']:
+        row = []
+        for symbol in alphabet:
+            mask = 0
+            for nxt in trans_by_state[s].get(symbol, ()):
+                mask |= eps_mask[index_of[nxt]]
+            row.append(mask)
+        move_mask.append(row)
+
+    # Bitmask of NFA accept states
+    accept_mask = 0
+    for s in nfa['accept_states']:
+        accept_mask |= 1 << index_of[s]
 
-    # Compute start subset as epsilon-closure of NFA start state
-    start_closure = epsilon_closure(nfa, {start_state})
+    # Start subset is epsilon-closure of NFA start state
+    start_closure = eps_mask[index_of[start_state]]
 
     # Map subsets of NFA states to DFA state indices
     subset_to_index = {}
-    subsets = []
+    subset_to_index[start_closure] = 0
 
-    start_frozen = frozenset(start_closure)
-    subset_to_index[start_frozen] = 0
-    subsets.append(start_closure)
+    # Queue of numbered subsets whose transitions are not built yet
+    pending = deque()
+    pending.append((0, start_closure))
 
     # Store DFA transitions and accept states
     dfa_transitions = {}
     dfa_accept_states = set()
 
-    index = 0
-    while index < len(subsets):
-        subset = subsets[index]
-        current_index = index
+    while pending:
+        current_index, subset = pending.popleft()
 
         # Build transitions for each input symbol from current subset
-        for symbol in alphabet:
-            move_set = move_nfa(nfa, subset, symbol)
-            if move_set:
-                target_closure = epsilon_closure(nfa, move_set)
-            else:
-                target_closure = set()
-
-            target_frozen = frozenset(target_closure)
-            if target_frozen not in subset_to_index:
-                new_index = len(subsets)
-                subset_to_index[target_frozen] = new_index
-                subsets.append(target_closure)
-            next_index = subset_to_index[target_frozen]
+        for sym_idx, symbol in enumerate(alphabet):
+            # Union closed move sets over each set bit of current subset
+            target_closure = 0
+            remaining = subset
+            while remaining:
+                low_bit = remaining & -remaining
+                target_closure |= move_mask[low_bit.bit_length() - 1][sym_idx]
+                remaining ^= low_bit
+
+            if target_closure not in subset_to_index:
+                new_index = len(subset_to_index)
+                subset_to_index[target_closure] = new_index
+                pending.append((new_index, target_closure))
+            next_index = subset_to_index[target_closure]
             dfa_transitions[(current_index, symbol)] = next_index
 
         # Mark DFA state as accepting if subset contains an NFA accept state
-        for s in subset:
-            if s in accept_states_nfa:
-                dfa_accept_states.add(current_index)
-                break
-
-        index += 1
+        if subset & accept_mask:
+            dfa_accept_states.add(current_index)
 
     # Build DFA structure from collected data
-    dfa_states = list(range(len(subsets)))
+    dfa_states = list(range(len(subset_to_index)))
     dfa = {
         'states': dfa_states,
         'alphabet': list(alphabet),
@@ -158,14 +181,13 @@ def dfa_to_tm_decider(dfa):
 
     return tm
 
-def format_configuration(state, tape, head_position):
-    # Format configuration string for current TM state and tape
-    tape_str = ''.join(tape)
+def format_configuration(state, tape_str, head_position):
+    # Format configuration string for current TM state and tape contents
     pointer_chars = []
 
     '''
     Code below can display a caret under the tape head position
-    for i in range(len(tape)):
+    for i in range(len(tape_str)):
         if i == head_position:
             pointer_chars.append('\t^')
         else:
@@ -177,49 +199,88 @@ def format_configuration(state, tape, head_position):
 
 def simulate_tm(tm, input_string, max_steps=None):
     # Simulate TM execution on a given input string
-    tape = []
-
-    for ch in input_string:
-        tape.append(ch)
-    tape.append(tm['blank'])
+    configurations = []
+    result = decide_tm(tm, input_string, max_steps, configurations)
+    return result, configurations
+
+def decide_tm(tm, input_string, max_steps=None, configurations=None):
+    # Run TM on input string, returning 1 to accept and 0 otherwise,
+    # and append each configuration when a list is given.
+    # Tables are packed on every call rather than read from the TM,
+    # so edits to its transitions are always seen. TMs that do not
+    # fit the packed layout run from their transition dict.
+    packed = pack_tm(tm)
+
+    # Input characters outside the tape alphabet also need the dict form
+    if packed is not None:
+        for ch in input_string:
+            if ch not in SYMBOL_CODE:
+                packed = None
+                break
 
+    if packed is None:
+        return run_dict_tm(tm, input_string, max_steps, configurations)
+    return run_packed_tm(tm, packed, input_string, max_steps, configurations)
+
+def extend_tape(tape, left, head, blank):
+    # Extend tape if head moves beyond current bounds and return the
+    # updated (left, head). Used tape starts at offset left, so blanks
+    # prepended in chunks serve several moves past the left end, and
+    # the chunk doubles whenever it runs out.
+    if head < 0:
+        if left == 0:
+            left = len(tape)
+            tape[:0] = [blank] * left
+        left -= 1
+        head = 0
+    if left + head >= len(tape):
+        tape.append(blank)
+
+    return left, head
+
+def run_dict_tm(tm, input_string, max_steps, configurations):
+    # Run TM by looking up (state, symbol) keys in its transition
+    # dict, recording configurations as in decide_tm. Tape
+    # cells hold symbol strings as given, so symbols outside the
+    # tape alphabet, non-ASCII or longer than one character work
+    blank = tm['blank']
+    tape = list(input_string)
+    tape.append(blank)
+
+    # Used tape starts at offset left, see extend_tape
+    left = 0
     head = 0
     state = tm['start_state']
-    accept_states = set(tm.get('accept_states', []))
-    reject_states = set(tm.get('reject_states', []))
-
-    configurations = []
+    transitions = tm['transitions']
+    accept_states = frozenset(tm.get('accept_states', []))
+    reject_states = frozenset(tm.get('reject_states', []))
     steps = 0
 
     while True:
         # Record configuration before each transition
-        configurations.append(format_configuration(state, tape, head))
+        if configurations is not None:
+            tape_str = ''.join(tape[left:])
+            configurations.append(format_configuration(state, tape_str, head))
 
         # Check accept and reject conditions
         if state in accept_states:
-            return 1, configurations
+            return 1
         if state in reject_states:
-            return 0, configurations
+            return 0
 
         # Enforce optional step limit
         if max_steps is not None and steps >= max_steps:
-            return 0, configurations
+            return 0
 
-        # Extend tape if head moves beyond current bounds
-        if head < 0:
-            tape.insert(0, tm['blank'])
-            head = 0
-        if head >= len(tape):
-            tape.append(tm['blank'])
+        left, head = extend_tape(tape, left, head, blank)
 
         # Read current symbol and apply transition rule
-        current_symbol = tape[head]
-        key = (state, current_symbol)
-        if key not in tm['transitions']:
-            return 0, configurations
+        key = (state, tape[left + head])
+        if key not in transitions:
+            return 0
 
-        nxt_st, tape_char, direction = tm['transitions'][key]
-        tape[head] = tape_char
+        nxt_st, tape_char, direction = transitions[key]
+        tape[left + head] = tape_char
 
         # Move head according to direction
         if direction == 'R':
@@ -231,6 +292,113 @@ def simulate_tm(tm, input_string, max_steps=None):
         state = nxt_st
         steps += 1
 
+def run_packed_tm(tm, packed, input_string, max_steps, configurations):
+    # Run TM from packed tables indexed by state * 3 + symbol code,
+    # recording configurations as in decide_tm
+    nxt, wrt, dir_, accept_mask, reject_mask = packed
+    num_symbols = len(TAPE_ALPHABET)
+
+    # Tape holds one symbol code per byte; every input character
+    # is a tape symbol, which decide_tm checks before choosing this
+    blank = SYMBOL_CODE[tm['blank']]
+    tape = bytearray()
+    for ch in input_string:
+        tape.append(SYMBOL_CODE[ch])
+    tape.append(blank)
+
+    # Used tape starts at offset left, see extend_tape
+    left = 0
+    head = 0
+    state = tm['start_state']
+    steps = 0
+
+    while True:
+        # Record configuration before each transition
+        if configurations is not None:
+            tape_str = tape[left:].translate(CODE_TO_ASCII).decode('ascii')
+            configurations.append(format_configuration(state, tape_str, head))
+
+        # Check accept and reject conditions
+        if accept_mask[state]:
+            return 1
+        if reject_mask[state]:
+            return 0
+
+        # Enforce optional step limit
+        if max_steps is not None and steps >= max_steps:
+            return 0
+
+        left, head = extend_tape(tape, left, head, blank)
+
+        # Read current symbol and apply transition rule
+        pos = state * num_symbols + tape[left + head]
+        if nxt[pos] < 0:
+            return 0
+
+        tape[left + head] = wrt[pos]
+        head += dir_[pos]
+
+        # Update current state and step counter
+        state = nxt[pos]
+        steps += 1
+
+def is_state_number(state, num_states):
+    # Check that state is an integer from 0 to num_states - 1
+    return isinstance(state, int) and 0 <= state < num_states
+
+def is_tape_symbol(symbol):
+    # Check that symbol is one of the tape alphabet characters
+    return isinstance(symbol, str) and symbol in SYMBOL_CODE
+
+def pack_tm(tm):
+    # Pack TM transitions into parallel lists indexed by
+    # state * len(TAPE_ALPHABET) + symbol code, with head
+    # moves stored as -1 or +1 and missing transitions as -1.
+    # Returns None unless every state is numbered 0 to
+    # num_states - 1 and every symbol is in the tape alphabet,
+    # since only those TMs fit the packed layout.
+    num_states = tm['num_states']
+    num_symbols = len(TAPE_ALPHABET)
+
+    if not isinstance(num_states, int):
+        return None
+    if not is_state_number(tm['start_state'], num_states):
+        return None
+    if not is_tape_symbol(tm['blank']):
+        return None
+
+    nxt = [-1] * (num_states * num_symbols)
+    wrt = [0] * (num_states * num_symbols)
+    dir_ = [0] * (num_states * num_symbols)
+
+    for (state, symbol), (nxt_st, tape_char, direction) in tm['transitions'].items():
+        if not is_state_number(state, num_states) or not is_state_number(nxt_st, num_states):
+            return None
+        if not is_tape_symbol(symbol) or not is_tape_symbol(tape_char):
+            return None
+
+        pos = state * num_symbols + SYMBOL_CODE[symbol]
+        nxt[pos] = nxt_st
+        wrt[pos] = SYMBOL_CODE[tape_char]
+        if direction == 'R':
+            dir_[pos] = 1
+        else:
+            dir_[pos] = -1
+
+    # Flag accept and reject states by state number
+    accept_mask = [False] * num_states
+    for s in tm.get('accept_states', []):
+        if not is_state_number(s, num_states):
+            return None
+        accept_mask[s] = True
+    reject_mask = [False] * num_states
+    for s in tm.get('reject_states', []):
+        if not is_state_number(s, num_states):
+            return None
+        reject_mask[s] = True
+
+    return nxt, wrt, dir_, accept_mask, reject_mask
+
 def build_example_nfa():
     # Build example NFA for conversion and testing
     states = [0, 1, 2]
@@ -256,33 +424,35 @@ def build_example_nfa():
 
 def print_dfa(dfa):
     # Print DFA description in a readable format
-    print("DFA states:", dfa['states'])
-    print("DFA start state:", dfa['start_state'])
-    print("DFA accept states:", dfa['accept_states'])
-    print("DFA transitions:")
-
-    sorted_items = sorted(dfa['transitions'].items())
-
-    for key, value in sorted_items:
+    # Collect lines and write them out in a single call
+    out = []
+    out.append(f"DFA states: {dfa['states']}")
+    out.append(f"DFA start state: {dfa['start_state']}")
+    out.append(f"DFA accept states: {dfa['accept_states']}")
+    out.append("DFA transitions:")
+
+    # Transitions were inserted by state, then by symbol
+    for key, value in dfa['transitions'].items():
         state, symbol = key
-        print(f"\tδ({state}, {symbol}) = {value}")
-    print()
+        out.append(f"\tδ({state}, {symbol}) = {value}")
+    sys.stdout.write('\n'.join(out) + '\n\n')
 
 def print_tm(tm):
     # Print TM decider description in a readable format
-    print("TM number of states:", tm['num_states'])
-    print("TM start state:", tm['start_state'])
-    print("TM accept states:", tm.get('accept_states', []))
-    print("TM reject states:", tm.get('reject_states', []))
-    print("TM transitions:")
-
-    sorted_items = sorted(tm['transitions'].items())
-
-    for key, value in sorted_items:
+    # Collect lines and write them out in a single call
+    out = []
+    out.append(f"TM number of states: {tm['num_states']}")
+    out.append(f"TM start state: {tm['start_state']}")
+    out.append(f"TM accept states: {tm.get('accept_states', [])}")
+    out.append(f"TM reject states: {tm.get('reject_states', [])}")
+    out.append("TM transitions:")
+
+    # Transitions were inserted by state, then by symbol
+    for key, value in tm['transitions'].items():
         state, read_symbol = key
         nxt_st, tape_char, direction = value
-        print(f"\tδ({state}, {read_symbol}) = ({nxt_st}, {tape_char}, {direction})")
-    print()
+        out.append(f"\tδ({state}, {read_symbol}) = ({nxt_st}, {tape_char}, {direction})")
+    sys.stdout.write('\n'.join(out) + '\n\n')
 
 def display_start_msg():
     # Display short description of program behavior
@@ -4,7 +4,9 @@ author: Carson Bragg
 date: Nov 11, 2025
 """
 
-from itertools import product
+import sys
+from functools import lru_cache
+from itertools import islice
 from typing import Final
 
 INPUT_ALPHABET: Final[list] = ['a', 'b']           
@@ -12,20 +14,26 @@ TAPE_ALPHABET: Final[list] = ['a', 'b', '_']
 MOVES: Final[list] = ['L', 'R']                    
 ENUMERATATION_COUNT: Final[int] = 20
 
+# Sentinel next state for halting rules, compared by identity
+HALT: Final[str] = 'HALT'
+
+@lru_cache(maxsize=None)
 def build_trans_table(states):
     # Constructs an empty table of transition functions
     # consiting of every combination of state and character
-    # from the tape alphabet.
+    # from the tape alphabet. Takes and returns tuples so
+    # results can be cached and shared without being mutated.
     trans_table = []
     
     for s in states:
         for sym in TAPE_ALPHABET:
             trans_table.append((s, sym))
 
-    return trans_table
+    return tuple(trans_table)
 
+@lru_cache(maxsize=None)
 def establish_rules(valid_next_states):
-    # Creates a list of all combinations of the tape 
+    # Creates a tuple of all combinations of the tape 
     # character to be written, the direction to move
     # the tape head, and the state the tm changes to.
     rules = []
@@ -35,7 +43,36 @@ def establish_rules(valid_next_states):
             for direction in MOVES:
                 rules.append((nxt_st, tape_char, direction))
 
-    return rules
+    return tuple(rules)
+
+def non_canonical_position(trans_table, rules, rule_indices):
+    # Checks that states are numbered in the order a breadth-first
+    # walk from state 0 first reaches them, reading the transition
+    # table in order. Machines that only differ by a relabeling of
+    # states, or that contain unreachable states, are skipped so
+    # one representative of each is enumerated.
+    #
+    # Returns None for a canonical machine. Otherwise returns the
+    # earliest table position whose rule, together with the rules
+    # before it, already rules out every machine sharing them.
+    next_label = 1
+
+    for pos in range(len(trans_table)):
+        state = trans_table[pos][0]
+        # State was never referenced by an earlier state, which
+        # the rules of the earlier states already decide
+        if state >= next_label:
+            return pos - 1
+
+        nxt_st = rules[rule_indices[pos]][0]
+        if nxt_st is HALT or nxt_st < next_label:
+            continue
+        # First reference to a new state must use the next label
+        if nxt_st != next_label:
+            return pos
+        next_label += 1
+
+    return None
 
 def enumerate_tms():
     # Generator that enumerates all Turing machines over 
@@ -51,20 +88,42 @@ def enumerate_tms():
     num_states = 1
 
     while True:
-        # builds list of states from 0 to number of states
-        states = list(range(num_states)) 
-        valid_next_states = states + ['HALT']
+        # builds tuple of states from 0 to number of states
+        states = tuple(range(num_states))
+        valid_next_states = states + (HALT,)
 
         # builds an empty transition table of TM
         trans_table = build_trans_table(states)
         
         rules = establish_rules(valid_next_states)
 
-        for combo in product(rules, repeat=len(trans_table)):
+        num_rules = len(rules)
+        num_positions = len(trans_table)
+
+        # Count through every rule assignment as a mixed-radix number,
+        # with the last table position as the fastest changing digit
+        num_candidates = num_rules ** num_positions
+        counter = 0
+
+        while counter < num_candidates:
+            rule_indices = [0] * num_positions
+            remainder = counter
+            for pos in range(num_positions - 1, -1, -1):
+                remainder, rule_indices[pos] = divmod(remainder, num_rules)
+
+            # Skip relabelings of machines already enumerated by moving
+            # straight to the next value of the offending digit
+            bad_pos = non_canonical_position(trans_table, rules, rule_indices)
+            if bad_pos is not None:
+                step = num_rules ** (num_positions - 1 - bad_pos)
+                counter = (counter // step + 1) * step
+                continue
+            counter += 1
+
             transitions = {}
-            for (pos, rule) in zip(trans_table, combo):
-                state, sym = pos
-                nxt_st, tape_Char, direction = rule
+            for pos in range(num_positions):
+                state, sym = trans_table[pos]
+                nxt_st, tape_char, direction = rules[rule_indices[pos]]
                 transitions[(state, sym)] = (nxt_st, tape_char, direction)
 
             tm = {
@@ -77,33 +136,38 @@ def enumerate_tms():
 
         num_states += 1
 
+def first_n_tms(n):
+    # Returns a list of the first n enumerated Turing machines.
+    # enumerate_tms decodes each machine from its counter on
+    # demand, so stopping after n never builds the rest.
+    return list(islice(enumerate_tms(), n))
+
 def print_tm(tm, index):
     # Prints out a single TM in a readable format.
-    print(f"TM #{index}")
-    print(f"  States Count: {tm['num_states']}")
-    print(f"  States: {list(range(tm['num_states']))}")
-    print(f"  Start state: {tm['start_state']}")
-    print(f"  Blank symbol: {tm['blank']}")
-    print("  Transitions:")
-
-    # Sort by state then symbol
-    for (state, sym), (nxt_st, tape_char, direction) in sorted(tm['transitions'].items()):
-        if nxt_st == 'HALT':
-            print(f"    δ(q{state}, {sym}) = HALT")
+    # Collect lines and write them out in a single call
+    out = []
+    out.append(f"TM #{index}")
+    out.append(f"  States Count: {tm['num_states']}")
+    out.append(f"  States: {list(range(tm['num_states']))}")
+    out.append(f"  Start state: {tm['start_state']}")
+    out.append(f"  Blank symbol: {tm['blank']}")
+    out.append("  Transitions:")
+
+    # Transitions are already ordered by state then symbol
+    for (state, sym), (nxt_st, tape_char, direction) in tm['transitions'].items():
+        if nxt_st is HALT:
+            out.append(f"    δ(q{state}, {sym}) = HALT")
         else:
-            print(f"    δ(q{state}, {sym}) = (q{nxt_st}, {tape_char}, {direction})")
-    print()
+            out.append(f"    δ(q{state}, {sym}) = (q{nxt_st}, {tape_char}, {direction})")
+    sys.stdout.write('\n'.join(out) + '\n\n')
 
 def main():
     # Starting point of Program Execution
-    tm_generator = enumerate_tms()
-
     print(f"\nFirst {ENUMERATATION_COUNT} Turning "+
             "Machines with {a,b} as \nthe alphabet "+
             "and {a,b,_} as the tape alphabet.\n")
 
-    for i in range(1, ENUMERATATION_COUNT+1):
-        tm = next(tm_generator)
+    for i, tm in enumerate(first_n_tms(ENUMERATATION_COUNT), start=1):
         print_tm(tm, i)
 
 if __name__ == "__main__":
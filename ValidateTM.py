@@ -4,74 +4,43 @@ author: Carson Bragg
 date: nov 10, 2025
 '''
 
-from itertools import product
+import sys
 from typing import Final
 
-# Global symbols for input alphabet, tape alphabet, and head moves
-INPUT_ALPHABET: Final[list] = ['a', 'b']
-TAPE_ALPHABET: Final[list] = ['a', 'b', '_']
-MOVES: Final[list] = ['L', 'R']
-
-def build_trans_table(states):
-    # Build all (state, tape_symbol) pairs for the transition table
-    trans_table = []
-    for s in states:
-        for sym in TAPE_ALPHABET:
-            trans_table.append((s, sym))
-    return trans_table
-
-def establish_rules(valid_next_states):
-    # Build all possible (next_state, write_symbol, move) rules
-    rules = []
-    for nxt_st in valid_next_states:
-        for tape_char in TAPE_ALPHABET:
-            for direction in MOVES:
-                rules.append((nxt_st, tape_char, direction))
-    return rules
-
-def enumerate_tms():
-    # Infinite generator that enumerates Turing machines by number of states
-    num_states = 1
-    while True:
-        states = list(range(num_states))
-        valid_next_states = states + ['HALT']
-        trans_table = build_trans_table(states)
-        rules = establish_rules(valid_next_states)
-
-        # Assign a rule to every (state, symbol) position
-        for combo in product(rules, repeat=len(trans_table)):
-            transitions = {}
-            for pos, rule in zip(trans_table, combo):
-                state, sym = pos
-                nxt_st, tape_char, direction = rule
-                transitions[(state, sym)] = (nxt_st, tape_char, direction)
-
-            # Build TM description dictionary
-            tm = {
-                'num_states': num_states,
-                'start_state': 0,
-                'blank': '_',
-                'transitions': transitions
-            }
-            yield tm
-
-        num_states += 1
+# Enumerator, tape alphabet, head moves, and halting state are
+# shared with the Section One program
+from EnumerateTM import HALT, MOVES, TAPE_ALPHABET, first_n_tms
+
+# Hashed copies of the symbol lists for membership checks
+TAPE_ALPHABET_SET: Final[frozenset] = frozenset(TAPE_ALPHABET)
+MOVES_SET: Final[frozenset] = frozenset(MOVES)
 
 def print_tm(tm, index):
     # Print TM header information and full transition function
-    print(f"TM #{index}")
-    print(f"  States Count: {tm['num_states']}")
-    print(f"  States: {list(range(tm['num_states']))}")
-    print(f"  Start state: {tm['start_state']}")
-    print(f"  Blank symbol: {tm['blank']}")
-    print("  Transitions:")
-    for item in sorted(tm['transitions'].items()):
+    # Collect lines and write them out in a single call
+    out = []
+    out.append(f"TM #{index}")
+    out.append(f"  States Count: {tm['num_states']}")
+    out.append(f"  States: {list(range(tm['num_states']))}")
+    out.append(f"  Start state: {tm['start_state']}")
+    out.append(f"  Blank symbol: {tm['blank']}")
+    out.append("  Transitions:")
+    # Transitions are already ordered by state then symbol
+    for item in tm['transitions'].items():
         (state, sym), (nxt_st, tape_char, direction) = item
-        if nxt_st == 'HALT':
-            print(f"    δ(q{state}, {sym}) = HALT")
+        if nxt_st == HALT:
+            out.append(f"    δ(q{state}, {sym}) = HALT")
         else:
-            print(f"    δ(q{state}, {sym}) = (q{nxt_st}, {tape_char}, {direction})")
-    print()
+            out.append(f"    δ(q{state}, {sym}) = (q{nxt_st}, {tape_char}, {direction})")
+    sys.stdout.write('\n'.join(out) + '\n\n')
+
+def in_set(value, members):
+    # Set membership that treats unhashable values as absent,
+    # so malformed TM fields are rejected instead of raising
+    try:
+        return value in members
+    except TypeError:
+        return False
 
 def validate_tm(tm):
     # Check for required keys in TM description
@@ -95,51 +64,35 @@ def validate_tm(tm):
     if num_states <= 0:
         return 0
 
-    states = list(range(num_states))
+    states = frozenset(range(num_states))
 
     # Check start state, blank symbol, and transitions container
-    if start_state not in states:
+    if not in_set(start_state, states):
         return 0
-    if blank not in TAPE_ALPHABET:
+    if not in_set(blank, TAPE_ALPHABET_SET):
         return 0
     if not isinstance(transitions, dict):
         return 0
 
-    # Check that each key is a valid (state, symbol) pair
-    for key in transitions:
-        if not isinstance(key, tuple):
-            return 0
-        if len(key) != 2:
-            return 0
-
-        state, sym = key
-
-        if state not in states:
-            return 0
-        if sym not in TAPE_ALPHABET:
-            return 0
-
-    # Check that every (state, symbol) pair appears in transitions
-    for s in states:
-        for sym in TAPE_ALPHABET:
-            if (s, sym) not in transitions:
-                return 0
+    # Keys must be exactly every (state, symbol) pair, with none missing or extra
+    expected_keys = {(s, sym) for s in states for sym in TAPE_ALPHABET}
+    if transitions.keys() != expected_keys:
+        return 0
 
     # Check structure and contents of transition values
-    for key in transitions:
-        value = transitions[key]
+    for value in transitions.values():
         if not isinstance(value, tuple):
             return 0
         if len(value) != 3:
             return 0
 
-        nxt_st, tape_char, direction = vaue
+        nxt_st, tape_char, direction = value
 
-        if nxt_st != 'HALT' and nxt_st not in states:
+        if nxt_st != HALT and not in_set(nxt_st, states):
             return 0
-        if tape_char not in TAPE_ALPHABET:
+        if not in_set(tape_char, TAPE_ALPHABET_SET):
             return 0
-        if direction not in MOVES:
+        if not in_set(direction, MOVES_SET):
             return 0
 
     return 1
@@ -185,12 +138,10 @@ def display_start_msg():
 def main():
     # Build example machines and run validation
     machines = []
-    tm_generator = enumerate_tms()
 
     display_start_msg()
 
-    valid_tm_1 = next(tm_generator)
-    valid_tm_2 = next(tm_generator)
+    valid_tm_1, valid_tm_2 = first_n_tms(2)
     invalid_tm_1 = make_invalid_missing_transition(valid_tm_1)
     invalid_tm_2 = make_invalid_blank_symbol(valid_tm_2)
 